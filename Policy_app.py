@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import pyarrow as pa
 import numpy as np
+from collections import namedtuple
+from numba import njit, prange
 
 # --- App Title and Description ---
 st.set_page_config(layout="wide")
@@ -37,131 +39,249 @@ swp_annual_payout_growth_rate_input = st.sidebar.slider("SWP Annual Payout Growt
 
 
 # --- Core Calculation Logic (Function) ---
-def calculate_policy_outcomes(
+@njit(cache=True, fastmath=True)
+def _run_swp(n_months, start_corpus, r_month, monthly_targets):
+    """
+    SWP-phase kernel: data-dependent branching (corpus exhaustion, payout
+    capping) resists vectorization, so the loop is compiled with Numba instead.
+    The target-payout schedule is precomputed by the caller, leaving only
+    corpus growth and the capped withdrawal in the loop body.
+    Returns (payout, corpus EOM) arrays of length n_months.
+    """
+    payout_arr = np.empty(n_months)
+    corpus_arr = np.empty(n_months)
+
+    corpus = start_corpus
+
+    for i in range(n_months):
+        target = monthly_targets[i]
+
+        if corpus <= 0.0:
+            payout = 0.0
+            corpus = 0.0
+        else:
+            corpus_after_growth = corpus * (1.0 + r_month)
+            if target >= corpus_after_growth:
+                payout = corpus_after_growth
+                corpus = 0.0
+            else:
+                payout = target
+                corpus = corpus_after_growth - payout
+
+        payout_arr[i] = payout
+        corpus_arr[i] = corpus
+
+    return payout_arr, corpus_arr
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_endstate(total_months, sip_duration_months, monthly_survival_benefit,
+                       sip_monthly_rate, corpus_monthly_rate, init_wd_rate, payout_growth):
+    """
+    Scalar version of the full simulation returning only the end state
+    (cumulative hybrid income, final SWP corpus). Used by the batch sweep.
+    """
+    if sip_monthly_rate != 0.0:
+        corpus = monthly_survival_benefit * ((1.0 + sip_monthly_rate) ** sip_duration_months - 1.0) / sip_monthly_rate
+    else:
+        corpus = monthly_survival_benefit * sip_duration_months
+
+    swp_months = total_months - sip_duration_months
+    cumulative_income = monthly_survival_benefit * total_months  # Survival benefit runs throughout
+    if swp_months <= 0:
+        return cumulative_income, 0.0
+
+    target = corpus * init_wd_rate / 12.0
+    for i in range(swp_months):
+        if i > 0 and i % 12 == 0:
+            target *= (1.0 + payout_growth)
+        if corpus <= 0.0:
+            corpus = 0.0
+        else:
+            corpus_after_growth = corpus * (1.0 + corpus_monthly_rate)
+            if target >= corpus_after_growth:
+                cumulative_income += corpus_after_growth
+                corpus = 0.0
+            else:
+                cumulative_income += target
+                corpus = corpus_after_growth - target
+
+    return cumulative_income, corpus
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def run_batch(sip_annual_rates, total_months, sip_duration_months, monthly_survival_benefit,
+              corpus_monthly_rate, init_wd_rate, payout_growth):
+    """Evaluates one scenario per SIP return rate, in parallel across cores."""
+    n_scenarios = sip_annual_rates.shape[0]
+    total_income = np.empty(n_scenarios)
+    final_corpus = np.empty(n_scenarios)
+    for k in prange(n_scenarios):
+        income_k, corpus_k = _simulate_endstate(
+            total_months, sip_duration_months, monthly_survival_benefit,
+            sip_annual_rates[k] / 12.0, corpus_monthly_rate, init_wd_rate, payout_growth
+        )
+        total_income[k] = income_k
+        final_corpus[k] = corpus_k
+    return total_income, final_corpus
+
+
+# Warm the kernels once per session: compilation (or loading the on-disk
+# cache) happens here rather than on the first slider interaction.
+if not st.session_state.get('_swp_kernel_warmed', False):
+    _run_swp(1, 1000.0, 0.01, np.full(1, 100.0))
+    run_batch(np.full(1, 0.1), 12, 6, 1000.0, 0.01, 0.1, 0.05)
+    st.session_state['_swp_kernel_warmed'] = True
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def run_simulation(
     current_age, monthly_survival_benefit, policy_end_age,
     sip_duration_years, sip_annual_return_rate,
     corpus_annual_growth_rate, swp_initial_annual_withdrawal_rate, swp_annual_payout_growth_rate
 ):
     """
-    Performs the month-by-month simulation based on the input parameters.
-    Returns a pandas DataFrame with the results.
+    Performs the simulation based on the input parameters.
+    Returns a dict of per-column NumPy arrays, one entry per month.
     """
     
     # Derived Parameters
     policy_duration_years = policy_end_age - current_age
     total_months = policy_duration_years * 12
-    sip_duration_months = sip_duration_years * 12
+    sip_duration_months = min(sip_duration_years * 12, total_months)
 
     monthly_sip_return_rate = sip_annual_return_rate / 12
     monthly_corpus_growth_rate = corpus_annual_growth_rate / 12
 
-    results_list = []
-
-    # Initial State Variables
-    primary_cumulative_income = 0.0
-    hybrid_sip_corpus = 0.0
-    hybrid_swp_corpus = 0.0
-    hybrid_cumulative_total_income = 0.0
-    scheduled_last_year_swp_monthly_payout = 0.0
-    swp_year_counter = 0
-    current_target_swp_monthly_payout = 0.0
-
-    for month_index in range(total_months):
-        age_at_month_start = current_age + (month_index / 12.0)
-        current_policy_year = month_index // 12 + 1
-        current_policy_month_in_year = month_index % 12
-
-        # Scenario 1: Primary Insurance Only
-        primary_monthly_income = monthly_survival_benefit
-        primary_cumulative_income += primary_monthly_income
-
-        # Scenario 2: Hybrid Policy
-        hybrid_survival_benefit_received_this_month = monthly_survival_benefit
-        current_sip_investment_this_month = 0.0
-        actual_swp_payout_this_month = 0.0
-        current_hybrid_swp_corpus_value_eom = 0.0 # Initialize for SIP phase
-
-        if month_index < sip_duration_months:
-            # --- SIP Phase ---
-            current_sip_investment_this_month = hybrid_survival_benefit_received_this_month
-            interest_on_sip = hybrid_sip_corpus * monthly_sip_return_rate
-            hybrid_sip_corpus += interest_on_sip
-            hybrid_sip_corpus += current_sip_investment_this_month
-            
-            hybrid_total_monthly_income_this_month = hybrid_survival_benefit_received_this_month
-            current_hybrid_swp_corpus_value_eom = 0.0 # No SWP corpus during SIP
-            actual_swp_payout_this_month = 0.0
-
-        else:
-            # --- SWP Phase ---
-            current_sip_investment_this_month = 0.0 # SIP investment stops
-
-            if month_index == sip_duration_months: # First month of SWP
-                hybrid_swp_corpus = hybrid_sip_corpus # Transfer final SIP corpus
-                swp_year_counter = 1
-                annual_swp_amount_year1 = hybrid_swp_corpus * swp_initial_annual_withdrawal_rate
-                current_target_swp_monthly_payout = annual_swp_amount_year1 / 12
-                scheduled_last_year_swp_monthly_payout = current_target_swp_monthly_payout
-            
-            if (month_index - sip_duration_months) > 0 and (month_index - sip_duration_months) % 12 == 0:
-                swp_year_counter += 1
-                current_target_swp_monthly_payout = scheduled_last_year_swp_monthly_payout * (1 + swp_annual_payout_growth_rate)
-                scheduled_last_year_swp_monthly_payout = current_target_swp_monthly_payout
-            
-            if hybrid_swp_corpus <= 0:
-                actual_swp_payout_this_month = 0.0
-                hybrid_swp_corpus = 0.0
-            else:
-                interest_on_swp_corpus = hybrid_swp_corpus * monthly_corpus_growth_rate
-                corpus_after_growth = hybrid_swp_corpus + interest_on_swp_corpus
-                
-                if current_target_swp_monthly_payout >= corpus_after_growth:
-                    actual_swp_payout_this_month = corpus_after_growth
-                    hybrid_swp_corpus = 0.0
-                else:
-                    actual_swp_payout_this_month = current_target_swp_monthly_payout
-                    hybrid_swp_corpus = corpus_after_growth - actual_swp_payout_this_month
-            
-            if hybrid_swp_corpus < 0: hybrid_swp_corpus = 0.0
-            
-            hybrid_total_monthly_income_this_month = hybrid_survival_benefit_received_this_month + actual_swp_payout_this_month
-            current_hybrid_swp_corpus_value_eom = hybrid_swp_corpus
-
-        hybrid_cumulative_total_income += hybrid_total_monthly_income_this_month
-
-        results_list.append({
-            'MonthIndex': month_index,
-            'Age': age_at_month_start,
-            'PolicyYear': current_policy_year,
-            'MonthInPolicyYear': current_policy_month_in_year + 1,
-            'Primary_MonthlyIncome': primary_monthly_income,
-            'Primary_CumulativeIncome': primary_cumulative_income,
-            'Hybrid_SurvivalBenefitReceived': hybrid_survival_benefit_received_this_month,
-            'Hybrid_SIPInvestment': current_sip_investment_this_month,
-            'Hybrid_SIPCorpus_EOM': hybrid_sip_corpus,
-            'Hybrid_SWPPayout': actual_swp_payout_this_month,
-            'Hybrid_SWPCorpus_EOM': current_hybrid_swp_corpus_value_eom,
-            'Hybrid_TotalMonthlyIncome': hybrid_total_monthly_income_this_month,
-            'Hybrid_CumulativeTotalIncome': hybrid_cumulative_total_income,
-            'SWP_Year': swp_year_counter if month_index >= sip_duration_months else 0,
-            'Target_SWP_Payout': current_target_swp_monthly_payout if month_index >= sip_duration_months else 0
-        })
-    
-    return pd.DataFrame(results_list)
+    # Scenario 1 (Primary Insurance Only) is a constant monthly benefit, so both
+    # columns have a closed form: build them as arrays instead of accumulating
+    # scalars inside the monthly loop.
+    primary_monthly_income_arr = np.full(total_months, monthly_survival_benefit, dtype=np.float64)
+    primary_cumulative_income_arr = np.cumsum(primary_monthly_income_arr)
+
+    # --- SIP Phase (closed form) ---
+    # The month loop `corpus = corpus*(1+r) + PMT` is an ordinary annuity, so the
+    # whole end-of-month corpus series is PMT * ((1+r)^n - 1) / r.
+    sip_months_arr = np.arange(1, sip_duration_months + 1)
+    if monthly_sip_return_rate != 0.0:
+        sip_growth = (1 + monthly_sip_return_rate) ** sip_months_arr
+        sip_corpus_eom = monthly_survival_benefit * (sip_growth - 1) / monthly_sip_return_rate
+    else:
+        sip_corpus_eom = monthly_survival_benefit * sip_months_arr.astype(np.float64)
+    final_sip_corpus = sip_corpus_eom[-1] if sip_duration_months > 0 else 0.0
+
+    # --- SWP Phase (compiled kernel) ---
+    # The target payout only steps once per SWP year, so the whole schedule is
+    # year-1 target * (1+g)^year expanded to months with np.repeat.
+    swp_months = total_months - sip_duration_months
+    n_swp_years = -(-swp_months // 12)
+    yearly_targets = (final_sip_corpus * swp_initial_annual_withdrawal_rate / 12.0) \
+        * (1 + swp_annual_payout_growth_rate) ** np.arange(n_swp_years)
+    swp_target = np.repeat(yearly_targets, 12)[:swp_months]
+    swp_payout, swp_corpus_eom = _run_swp(
+        swp_months, final_sip_corpus, monthly_corpus_growth_rate, swp_target
+    )
+
+    # --- Assemble: one preallocated array per column, filled by phase slice ---
+    # Columns are allocated at display-adequate widths: rupee amounts up to
+    # ~10^9 fit comfortably in a float32 mantissa, and the index columns are
+    # small integers. Halves the frame's footprint and Arrow payload.
+    month_index = np.arange(total_months)
+    arrs = {
+        'MonthIndex': month_index.astype(np.int32),
+        'Age': (current_age + month_index / 12.0).astype(np.float32),
+        'PolicyYear': (month_index // 12 + 1).astype(np.int16),
+        'MonthInPolicyYear': (month_index % 12 + 1).astype(np.int8),
+        'Primary_MonthlyIncome': primary_monthly_income_arr.astype(np.float32),
+        'Primary_CumulativeIncome': primary_cumulative_income_arr.astype(np.float32),
+        'Hybrid_SurvivalBenefitReceived': np.full(total_months, monthly_survival_benefit, dtype=np.float32),
+        'Hybrid_SIPInvestment': np.zeros(total_months, dtype=np.float32),
+        'Hybrid_SIPCorpus_EOM': np.full(total_months, final_sip_corpus, dtype=np.float32),
+        'Hybrid_SWPPayout': np.zeros(total_months, dtype=np.float32),
+        'Hybrid_SWPCorpus_EOM': np.zeros(total_months, dtype=np.float32),
+        'Hybrid_TotalMonthlyIncome': np.full(total_months, monthly_survival_benefit, dtype=np.float32),
+        'Hybrid_CumulativeTotalIncome': np.empty(total_months, dtype=np.float32),
+        'SWP_Year': np.zeros(total_months, dtype=np.int16),
+        'Target_SWP_Payout': np.zeros(total_months, dtype=np.float32),
+    }
+
+    sip = slice(0, sip_duration_months)
+    arrs['Hybrid_SIPInvestment'][sip] = monthly_survival_benefit
+    arrs['Hybrid_SIPCorpus_EOM'][sip] = sip_corpus_eom
+    arrs['Hybrid_CumulativeTotalIncome'][sip] = monthly_survival_benefit * sip_months_arr.astype(np.float64)
+
+    swp = slice(sip_duration_months, total_months)
+    hybrid_total_monthly_income = monthly_survival_benefit + swp_payout
+    arrs['Hybrid_SWPPayout'][swp] = swp_payout
+    arrs['Hybrid_SWPCorpus_EOM'][swp] = swp_corpus_eom
+    arrs['Hybrid_TotalMonthlyIncome'][swp] = hybrid_total_monthly_income
+    arrs['Hybrid_CumulativeTotalIncome'][swp] = monthly_survival_benefit * sip_duration_months + np.cumsum(hybrid_total_monthly_income)
+    arrs['SWP_Year'][swp] = np.arange(swp_months) // 12 + 1
+    arrs['Target_SWP_Payout'][swp] = swp_target
+
+    return arrs
+
+
+PolicySummary = namedtuple('PolicySummary', [
+    'final_primary_cumulative_income',
+    'final_hybrid_cumulative_total_income',
+    'final_hybrid_swp_corpus',
+])
+
+
+def summarize(arrays):
+    """Extracts the three scalars shown in the metrics block."""
+    if arrays['MonthIndex'].size == 0:
+        return PolicySummary(0.0, 0.0, 0.0)
+    return PolicySummary(
+        float(arrays['Primary_CumulativeIncome'][-1]),
+        float(arrays['Hybrid_CumulativeTotalIncome'][-1]),
+        float(arrays['Hybrid_SWPCorpus_EOM'][-1]),
+    )
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def to_dataframe(params):
+    """Builds the full month-by-month DataFrame; only needed for the table."""
+    # Arrow-backed dtypes let st.dataframe serialize to Arrow IPC without
+    # copying out of NumPy buffers first; the cast preserves the narrowed
+    # column widths rather than letting convert_dtypes re-infer them.
+    df = pd.DataFrame(run_simulation(*params), copy=False)
+    return df.astype({col: pd.ArrowDtype(pa.from_numpy_dtype(dtype)) for col, dtype in df.dtypes.items()})
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def run_sip_rate_sweep(params, n_points=20):
+    """Sweeps the SIP annual return rate with the other parameters held fixed."""
+    (current_age, monthly_survival_benefit, policy_end_age, sip_duration_years,
+     _sip_annual_return_rate, corpus_annual_growth_rate,
+     swp_initial_annual_withdrawal_rate, swp_annual_payout_growth_rate) = params
+    total_months = (policy_end_age - current_age) * 12
+    sip_duration_months = min(sip_duration_years * 12, total_months)
+    rates = np.linspace(0.01, 0.25, n_points)
+    total_income, final_corpus = run_batch(
+        rates, total_months, sip_duration_months, float(monthly_survival_benefit),
+        corpus_annual_growth_rate / 12, swp_initial_annual_withdrawal_rate,
+        swp_annual_payout_growth_rate
+    )
+    return rates, total_income, final_corpus
 
 # --- Perform Calculations based on Inputs ---
-df_results = calculate_policy_outcomes(
+sim_params = (
     current_age_input, monthly_survival_benefit_input, policy_end_age_input,
     sip_duration_years_input, sip_annual_return_rate_input,
     corpus_annual_growth_rate_input, swp_initial_annual_withdrawal_rate_input, swp_annual_payout_growth_rate_input
 )
+sim_arrays = run_simulation(*sim_params)
+has_results = sim_arrays['MonthIndex'].size > 0
 
 # --- Display Key Metrics Summary ---
 st.header("📊 Key Metrics Summary")
 
-final_primary_cumulative_income = df_results['Primary_CumulativeIncome'].iloc[-1] if not df_results.empty else 0
-final_hybrid_cumulative_total_income = df_results['Hybrid_CumulativeTotalIncome'].iloc[-1] if not df_results.empty else 0
-final_hybrid_swp_corpus = df_results['Hybrid_SWPCorpus_EOM'].iloc[-1] if not df_results.empty else 0
+summary = summarize(sim_arrays)
+final_primary_cumulative_income = summary.final_primary_cumulative_income
+final_hybrid_cumulative_total_income = summary.final_hybrid_cumulative_total_income
+final_hybrid_swp_corpus = summary.final_hybrid_swp_corpus
 additional_cumulative_income_from_hybrid = final_hybrid_cumulative_total_income - final_primary_cumulative_income
 
 col1, col2, col3 = st.columns(3)
@@ -178,97 +298,92 @@ with col3:
 st.markdown("---")
 st.header("Visualizations")
 
-if not df_results.empty:
-    # --- Plotting Visualizations ---
-    plt.style.use('seaborn-v0_8-whitegrid')
-
-    # Plot 1: Monthly Income Comparison
-    fig1, ax1 = plt.subplots(figsize=(12, 6))
-    ax1.plot(df_results['Age'], df_results['Primary_MonthlyIncome'], label='Primary Policy Only - Monthly Income', linestyle='--')
-    ax1.plot(df_results['Age'], df_results['Hybrid_TotalMonthlyIncome'], label='Hybrid Policy - Total Monthly Income', color='green', linewidth=2)
-    ax1.axvline(x=current_age_input + sip_duration_years_input, color='gray', linestyle=':', linewidth=2, label=f'SWP Starts (Age {current_age_input + sip_duration_years_input})')
-    ax1.set_xlabel('Age (Years)', fontsize=10)
-    ax1.set_ylabel('Monthly Income (₹)', fontsize=10)
-    ax1.set_title('Monthly Income Comparison', fontsize=12)
-    ax1.legend(fontsize=8)
-    ax1.grid(True, which='both', linestyle='--', linewidth=0.5)
-    plt.tight_layout()
-    st.pyplot(fig1)
-
-    # Plot 2: Cumulative Income Comparison
-    fig2, ax2 = plt.subplots(figsize=(12, 6))
-    ax2.plot(df_results['Age'], df_results['Primary_CumulativeIncome'], label='Primary Policy Only - Cumulative Income', linestyle='--')
-    ax2.plot(df_results['Age'], df_results['Hybrid_CumulativeTotalIncome'], label='Hybrid Policy - Cumulative Total Income', color='green', linewidth=2)
-    ax2.axvline(x=current_age_input + sip_duration_years_input, color='gray', linestyle=':', linewidth=2, label=f'SWP Starts (Age {current_age_input + sip_duration_years_input})')
-    ax2.set_xlabel('Age (Years)', fontsize=10)
-    ax2.set_ylabel('Cumulative Income (₹)', fontsize=10)
-    ax2.set_title('Cumulative Income Comparison', fontsize=12)
-    ax2.ticklabel_format(style='plain', axis='y')
-    ax2.legend(fontsize=8)
-    ax2.grid(True, which='both', linestyle='--', linewidth=0.5)
-    plt.tight_layout()
-    st.pyplot(fig2)
-
-    # Plot 3: Hybrid Policy Investment Corpus Growth
-    fig3, ax3 = plt.subplots(figsize=(12, 6))
-    ax3.plot(df_results['Age'], df_results['Hybrid_SIPCorpus_EOM'], label='SIP Corpus Value', color='blue', linestyle='-.')
-    swp_phase_df = df_results[df_results['MonthIndex'] >= (sip_duration_years_input * 12)]
-    if not swp_phase_df.empty:
-        ax3.plot(swp_phase_df['Age'], swp_phase_df['Hybrid_SWPCorpus_EOM'], label='SWP Corpus Value (During SWP Phase)', color='purple', linewidth=2)
-    ax3.axvline(x=current_age_input + sip_duration_years_input, color='gray', linestyle=':', linewidth=2, label=f'SIP Ends / SWP Starts (Age {current_age_input + sip_duration_years_input})')
-    ax3.set_xlabel('Age (Years)', fontsize=10)
-    ax3.set_ylabel('Corpus Value (₹)', fontsize=10)
-    ax3.set_title('Hybrid Policy: Investment Corpus Growth (SIP & SWP)', fontsize=12)
-    ax3.ticklabel_format(style='plain', axis='y')
-    ax3.legend(fontsize=8)
-    ax3.grid(True, which='both', linestyle='--', linewidth=0.5)
-    plt.tight_layout()
-    st.pyplot(fig3)
-
-    # Plot 4: Breakdown of Hybrid Monthly Income During SWP Phase
-    fig4, ax4 = plt.subplots(figsize=(12, 6))
-    swp_phase_plot_df = df_results[df_results['MonthIndex'] >= (sip_duration_years_input * 12)].copy()
-    if not swp_phase_plot_df.empty:
-        ax4.stackplot(swp_phase_plot_df['Age'],
-                      swp_phase_plot_df['Hybrid_SurvivalBenefitReceived'],
-                      swp_phase_plot_df['Hybrid_SWPPayout'],
-                      labels=['Survival Benefit (Primary Policy)', 'SWP Payout (Investment Corpus)'],
-                      colors=['skyblue', 'orange'],
-                      alpha=0.8)
-        ax4.plot(swp_phase_plot_df['Age'], swp_phase_plot_df['Hybrid_TotalMonthlyIncome'], label='Total Hybrid Monthly Income', color='black', linestyle='--', linewidth=1.5)
-        ax4.set_xlabel('Age (Years - During SWP Phase)', fontsize=10)
-        ax4.set_ylabel('Monthly Income Components (₹)', fontsize=10)
-        ax4.set_title('Breakdown of Hybrid Policy Monthly Income (SWP Phase)', fontsize=12)
-        ax4.legend(loc='upper left', fontsize=8)
-        ax4.grid(True, which='both', linestyle='--', linewidth=0.5)
-        plt.tight_layout()
-        st.pyplot(fig4)
+projections_tab, sweep_tab = st.tabs(["📈 Projections", "🔀 Sensitivity Sweep"])
+
+with projections_tab:
+    if has_results:
+        # Native Streamlit charts render client-side from Arrow data, so no
+        # server-side figure rasterization happens on reruns.
+        age_index = pd.Index(sim_arrays['Age'], name='Age')
+        swp_start_age = current_age_input + sip_duration_years_input
+        # MonthIndex is monotonic, so the SWP phase is a plain slice rather
+        # than a boolean mask.
+        total_months = sim_arrays['MonthIndex'].size
+        swp_start = min(sip_duration_years_input * 12, total_months)
+        has_swp_phase = swp_start < total_months
+
+        # Plot 1: Monthly Income Comparison
+        st.subheader("Monthly Income Comparison")
+        st.line_chart(pd.DataFrame({
+            'Primary Policy Only - Monthly Income': sim_arrays['Primary_MonthlyIncome'],
+            'Hybrid Policy - Total Monthly Income': sim_arrays['Hybrid_TotalMonthlyIncome'],
+        }, index=age_index))
+        st.caption(f"SWP starts at age {swp_start_age}.")
+
+        # Plot 2: Cumulative Income Comparison
+        st.subheader("Cumulative Income Comparison")
+        st.line_chart(pd.DataFrame({
+            'Primary Policy Only - Cumulative Income': sim_arrays['Primary_CumulativeIncome'],
+            'Hybrid Policy - Cumulative Total Income': sim_arrays['Hybrid_CumulativeTotalIncome'],
+        }, index=age_index))
+        st.caption(f"SWP starts at age {swp_start_age}.")
+
+        # Plot 3: Hybrid Policy Investment Corpus Growth
+        st.subheader("Hybrid Policy: Investment Corpus Growth (SIP & SWP)")
+        swp_corpus_display = np.full(total_months, np.nan, dtype=np.float32)
+        swp_corpus_display[swp_start:] = sim_arrays['Hybrid_SWPCorpus_EOM'][swp_start:]
+        st.line_chart(pd.DataFrame({
+            'SIP Corpus Value': sim_arrays['Hybrid_SIPCorpus_EOM'],
+            'SWP Corpus Value (During SWP Phase)': swp_corpus_display,
+        }, index=age_index))
+        st.caption(f"SIP ends / SWP starts at age {swp_start_age}.")
+
+        # Plot 4: Breakdown of Hybrid Monthly Income During SWP Phase
+        st.subheader("Breakdown of Hybrid Policy Monthly Income (SWP Phase)")
+        if has_swp_phase:
+            st.area_chart(pd.DataFrame({
+                'Survival Benefit (Primary Policy)': sim_arrays['Hybrid_SurvivalBenefitReceived'][swp_start:],
+                'SWP Payout (Investment Corpus)': sim_arrays['Hybrid_SWPPayout'][swp_start:],
+            }, index=age_index[swp_start:]))
+        else:
+            st.markdown("SWP phase not reached with current parameters or data is empty for SWP plot.")
     else:
-        st.markdown("SWP phase not reached with current parameters or data is empty for SWP plot.")
-else:
-    st.warning("No data to display. This might happen if the policy duration is too short or parameters are invalid.")
+        st.warning("No data to display. This might happen if the policy duration is too short or parameters are invalid.")
+
+with sweep_tab:
+    st.subheader("Sensitivity to SIP Annual Return Rate")
+    st.markdown("Final outcomes across a range of SIP return assumptions, with all other parameters held fixed:")
+    sweep_rates, sweep_income, sweep_corpus = run_sip_rate_sweep(sim_params)
+    st.line_chart(pd.DataFrame({
+        'Hybrid Policy: Total Income': sweep_income,
+        'Hybrid Policy: Final Corpus': sweep_corpus,
+    }, index=pd.Index(np.round(sweep_rates * 100, 2), name='SIP Annual Return Rate (%)')))
+    st.caption(f"Current assumption: {sip_annual_return_rate_input * 100:.1f}% annual SIP return.")
 
 st.markdown("---")
 st.subheader("Detailed Data Table")
 st.markdown("You can inspect the month-by-month calculations below:")
 
-# Display a portion of the DataFrame (e.g., with a checkbox to show all)
-if not df_results.empty:
+# Display a portion of the DataFrame (e.g., with a checkbox to show all).
+# The DataFrame itself is only materialized here, where the table needs it.
+if has_results:
+    df_results = to_dataframe(sim_params)
+
+    # Format monetary columns in the browser via column_config instead of a
+    # Styler, which would cost one Python call per cell.
+    monetary_cols = [
+        'Primary_MonthlyIncome', 'Primary_CumulativeIncome',
+        'Hybrid_SurvivalBenefitReceived', 'Hybrid_SIPInvestment', 'Hybrid_SIPCorpus_EOM',
+        'Hybrid_SWPPayout', 'Hybrid_SWPCorpus_EOM', 'Hybrid_TotalMonthlyIncome',
+        'Hybrid_CumulativeTotalIncome', 'Target_SWP_Payout'
+    ]
+    table_column_config = {c: st.column_config.NumberColumn(format="%.2f") for c in monetary_cols}
+
     # Add an option to show the full table, as it can be very long
     if st.checkbox("Show Full Detailed Data Table (can be very long)", False):
-        st.dataframe(df_results.style.format("{:,.2f}", subset=pd.IndexSlice[:, [
-            'Primary_MonthlyIncome', 'Primary_CumulativeIncome',
-            'Hybrid_SurvivalBenefitReceived', 'Hybrid_SIPInvestment', 'Hybrid_SIPCorpus_EOM',
-            'Hybrid_SWPPayout', 'Hybrid_SWPCorpus_EOM', 'Hybrid_TotalMonthlyIncome',
-            'Hybrid_CumulativeTotalIncome', 'Target_SWP_Payout'
-        ]]))
+        st.dataframe(df_results, column_config=table_column_config)
     else:
-        st.dataframe(df_results.head(12*2).style.format("{:,.2f}", subset=pd.IndexSlice[:, [
-            'Primary_MonthlyIncome', 'Primary_CumulativeIncome',
-            'Hybrid_SurvivalBenefitReceived', 'Hybrid_SIPInvestment', 'Hybrid_SIPCorpus_EOM',
-            'Hybrid_SWPPayout', 'Hybrid_SWPCorpus_EOM', 'Hybrid_TotalMonthlyIncome',
-            'Hybrid_CumulativeTotalIncome', 'Target_SWP_Payout'
-        ]]))
+        st.dataframe(df_results.head(12*2), column_config=table_column_config)
         st.caption("Showing first 2 years of data. Check the box above to see the full table.")
 
 st.sidebar.markdown("---")